@@ -24,7 +24,7 @@ transmitter channel modulation.
 
 """
 
-from typing import List, Dict, Union, Optional, Any
+from typing import List, Dict, Tuple, Union, Optional, Any
 import numpy as np
 from numpy.typing import NDArray
 
@@ -36,6 +36,12 @@ DEFAULT_PATTERN_DB = [0, 0]
 DEFAULT_GRID_SIZE = 1.0
 DEGREES_TO_RADIANS = np.pi / 180
 
+# Per-channel scalars, stored together so one record holds a channel's values
+_CHANNEL_DTYPE = np.dtype([("delay", "f8"), ("grid", "f8"), ("gain", "f8")])
+
+# Shared by all channels without waveform modulation, must not be modified
+_DISABLED_WAVEFORM_MOD = {"enabled": False, "var": None, "t": None}
+
 
 class Transmitter:
     """
@@ -148,12 +154,20 @@ class Transmitter:
           3D locations of the transmitter channels [x, y, z] in meters.
         - **polarization** (*numpy.ndarray*): Polarization vectors of the transmitter channels.
         - **waveform_mod** (*dict*): Waveform modulation parameters.
-        - **pulse_mod** (*dict*): Pulse modulation parameters.
+        - **pulse_mod** (*numpy.ndarray*): Pulse modulation of each channel
+          [channels, pulses]. Real-valued when no channel sets ``pulse_phs``.
         - **az_angles** (*numpy.ndarray*): Azimuth angles (°).
         - **az_patterns** (*numpy.ndarray*): Azimuth patterns (dB).
         - **el_angles** (*numpy.ndarray*): Elevation angles (°).
         - **el_patterns** (*numpy.ndarray*): Elevation patterns (dB).
+        - **az_angles_mat**, **az_patterns_mat**, **el_angles_mat**,
+          **el_patterns_mat** (*numpy.ndarray*): The angles and patterns above
+          as [channels, points] arrays, or ``None`` when their lengths differ
+          between channels.
         - **antenna_gains** (*numpy.ndarray*): Transmitter antenna gains (dB).
+        - **channel_params** (*numpy.ndarray*): Structured array with the
+          ``delay``, ``grid`` and ``gain`` of each channel. ``delay``, ``grid``
+          and ``antenna_gains`` are views of its fields.
 
     **Usage Examples**:
 
@@ -222,7 +236,10 @@ class Transmitter:
         pn_f: Optional[NDArray] = None,
         pn_power: Optional[NDArray] = None,
         channels: Optional[List[Dict]] = None,
+        _validated: bool = False,
     ):
+        # `_validated` is private: internal callers that have already
+        # validated their inputs set it to skip the property validation
         # Input validation
         if pulses < 1:
             raise ValueError("Number of pulses must be at least 1")
@@ -236,21 +253,20 @@ class Transmitter:
         self.rf_prop["tx_power"] = tx_power
         self.rf_prop["pn_f"] = pn_f
         self.rf_prop["pn_power"] = pn_power
-        self.validate_rf_prop(self.rf_prop)
+        if not _validated:
+            self.validate_rf_prop(self.rf_prop)
 
         # get `f(t)`
         # the length of `f` should be the same as `t`
         f = self._ensure_array(f)
 
-        if isinstance(t, (list, tuple, np.ndarray)):
-            t_array = np.array(t)
+        t_array = self._ensure_array(t, 0.0)
+        if t_array[0] != 0:
             t_array = t_array - t_array[0]
-        else:
-            t_array = np.array([0, t])
 
         self.waveform_prop["f"] = f
         self.waveform_prop["t"] = t_array
-        self.waveform_prop["bandwidth"] = np.max(f) - np.min(f)
+        self.waveform_prop["bandwidth"] = np.ptp(f)
         self.waveform_prop["pulse_length"] = t_array[-1]
         self.waveform_prop["pulses"] = pulses
 
@@ -259,11 +275,10 @@ class Transmitter:
         if f_offset is None:
             f_offset = np.zeros(pulses)
         else:
-            if isinstance(f_offset, (list, tuple, np.ndarray)):
-                f_offset = np.array(f_offset)
-            else:
+            f_offset = np.asarray(f_offset)
+            if f_offset.ndim == 0:
                 # Scalar case - expand to all pulses
-                f_offset = f_offset + np.zeros(pulses)
+                f_offset = np.full(pulses, f_offset, dtype=np.float64)
 
             if len(f_offset) != pulses:
                 raise ValueError(
@@ -274,24 +289,55 @@ class Transmitter:
         # Extend `prp` to a numpy.1darray.
         # Length equals to `pulses`
         if prp is None:
-            prp_array = self.waveform_prop["pulse_length"] + np.zeros(pulses)
+            prp_array = np.full(
+                pulses, self.waveform_prop["pulse_length"], dtype=np.float64
+            )
         else:
-            if isinstance(prp, (list, tuple, np.ndarray)):
-                prp_array = np.array(prp)
-            else:
-                prp_array = prp + np.zeros(pulses)
+            prp_array = np.asarray(prp)
+            if prp_array.ndim == 0:
+                prp_array = np.full(pulses, prp_array, dtype=np.float64)
         self.waveform_prop["prp"] = prp_array
 
         # start time of each pulse, without considering the delay
-        self.waveform_prop["pulse_start_time"] = np.cumsum(prp_array) - prp_array[0]
+        # single-pass equivalent of `np.cumsum(prp_array) - prp_array[0]`
+        pulse_start_time = np.empty(len(prp_array))
+        pulse_start_time[0] = 0.0
+        np.cumsum(prp_array[1:], out=pulse_start_time[1:])
+        self.waveform_prop["pulse_start_time"] = pulse_start_time
 
-        self.validate_waveform_prop(self.waveform_prop)
+        if not _validated:
+            self.validate_waveform_prop(self.waveform_prop)
 
         if channels is None:
             channels = [{"location": (0, 0, 0)}]
 
         self.txchannel_prop = self.process_txchannel_prop(channels)
 
+    @classmethod
+    def linear_fm(
+        cls, f_start: float, f_stop: float, pulse_length: float, **kwargs
+    ) -> "Transmitter":
+        """
+        Create a transmitter with a linear frequency modulated waveform.
+
+        Equivalent to ``Transmitter(f=[f_start, f_stop], t=pulse_length, ...)``,
+        but builds the ``f`` and ``t`` arrays directly so no input coercion
+        is needed.
+
+        :param float f_start: Start frequency of the chirp (Hz)
+        :param float f_stop: Stop frequency of the chirp (Hz)
+        :param float pulse_length: Duration of the chirp (s)
+        :param kwargs: Other keyword arguments of :class:`Transmitter`
+
+        :return: Transmitter with a linear frequency modulated waveform
+        :rtype: Transmitter
+        """
+        return cls(
+            f=np.array([f_start, f_stop], dtype=np.float64),
+            t=np.array([0.0, pulse_length]),
+            **kwargs,
+        )
+
     @staticmethod
     def _validate_array_lengths(
         arr1: NDArray, arr2: NDArray, name1: str, name2: str
@@ -306,13 +352,71 @@ class Transmitter:
     def _ensure_array(
         value: Union[float, List, NDArray], default_value: Optional[float] = None
     ) -> NDArray:
-        """Helper method to ensure a value is converted to a numpy array."""
-        if isinstance(value, (list, tuple, np.ndarray)):
-            return np.array(value)
-        else:
-            if default_value is not None:
-                return np.array([default_value, value])
-            return np.array([value, value])
+        """
+        Helper method to ensure a value is converted to a numpy array.
+
+        Array inputs are returned without copying. Scalars are expanded to
+        ``[default_value, value]``, or ``[value, value]`` without a default.
+        """
+        array = np.asarray(value)
+        if array.ndim:
+            return array
+        if default_value is not None:
+            return np.array([default_value, value])
+        return np.array([value, value])
+
+    @staticmethod
+    def _stack_uniform(arrays: List[NDArray]) -> Optional[NDArray]:
+        """
+        Helper method to stack equal-length 1D arrays into a 2D array.
+
+        :return: Stacked array, or ``None`` when the lengths differ
+        :rtype: numpy.2darray
+        """
+        if len({len(array) for array in arrays}) != 1:
+            return None
+        return np.array(arrays, dtype=np.float64)
+
+    @staticmethod
+    def _normalize_patterns(
+        patterns: List[NDArray], pattern_mat: Optional[NDArray] = None
+    ) -> Tuple[List[NDArray], NDArray]:
+        """
+        Helper method to normalize antenna patterns to their peak values.
+
+        When the stacked `pattern_mat` is given, it is normalized in place
+        and the returned patterns are views of its rows.
+
+        :return: Normalized patterns and the peak value of each pattern
+        :rtype: tuple
+        """
+        if pattern_mat is not None:
+            peaks = pattern_mat.max(axis=1)
+            pattern_mat -= peaks[:, np.newaxis]
+            return list(pattern_mat), peaks
+
+        peaks = np.array([np.max(pattern) for pattern in patterns], dtype=np.float64)
+        return [pattern - peak for pattern, peak in zip(patterns, peaks)], peaks
+
+    @staticmethod
+    def _polar_to_complex(
+        amp: NDArray, phs: NDArray, out: Optional[NDArray] = None
+    ) -> NDArray:
+        """
+        Helper method to compute ``amp * exp(1j * phs)`` with `phs` in degrees.
+
+        The real and imaginary parts are written in place with cos and sin,
+        avoiding the complex temporaries of ``np.exp``.
+        """
+        if out is None:
+            out = np.empty(np.shape(phs), dtype=complex)
+
+        np.multiply(phs, DEGREES_TO_RADIANS, out=out.real)
+        np.sin(out.real, out=out.imag)
+        np.cos(out.real, out=out.real)
+        out *= amp
+
+        return out
 
     def validate_rf_prop(self, rf_prop: Dict) -> None:
         """
@@ -356,9 +460,10 @@ class Transmitter:
                 f"pulses ({waveform_prop['pulses']})"
             )
 
-        if np.min(waveform_prop["prp"]) < waveform_prop["pulse_length"]:
+        min_prp = np.asarray(waveform_prop["prp"]).min()
+        if min_prp < waveform_prop["pulse_length"]:
             raise ValueError(
-                f"All PRP values ({np.min(waveform_prop['prp']):.2e} s) must be >= "
+                f"All PRP values ({min_prp:.2e} s) must be >= "
                 f"pulse_length ({waveform_prop['pulse_length']:.2e} s)"
             )
 
@@ -379,15 +484,17 @@ class Transmitter:
             Waveform modulation dictionary
         :rtype: dict
         """
+        # Modulation is disabled unless `mod_t` and at least one of `amp`
+        # and `phs` are given, checked before any array is created
+        if mod_t is None or (amp is None and phs is None):
+            return _DISABLED_WAVEFORM_MOD
+
         # Handle None cases
-        if phs is not None and amp is None:
+        if amp is None:
             amp = np.ones_like(phs)
-        elif phs is None and amp is not None:
+        elif phs is None:
             phs = np.zeros_like(amp)
 
-        if mod_t is None or amp is None or phs is None:
-            return {"enabled": False, "var": None, "t": None}
-
         # Convert to arrays
         amp = self._ensure_array(amp)
         phs = self._ensure_array(phs)
@@ -397,38 +504,46 @@ class Transmitter:
         self._validate_array_lengths(amp, phs, "amp", "phs")
         self._validate_array_lengths(mod_t, amp, "mod_t", "amp")
 
-        mod_var = amp * np.exp(1j * phs * DEGREES_TO_RADIANS)
+        mod_var = self._polar_to_complex(amp, phs)
 
         return {"enabled": True, "var": mod_var, "t": mod_t}
 
     def process_pulse_modulation(
-        self, pulse_amp: NDArray, pulse_phs: NDArray
+        self,
+        pulse_amp: NDArray,
+        pulse_phs: NDArray,
+        out: Optional[NDArray] = None,
     ) -> NDArray:
         """
         Process pulse modulation parameters
 
-        :param numpy.1darray pulse_amp:
+        Arrays may also be 2D with one row per channel, in which case the
+        modulation of all the channels is computed in a single pass.
+
+        :param numpy.ndarray pulse_amp:
             Relative amplitude sequence for pulse's amplitude modulation.
             The array length should be the same as `pulses`. ``default 1``
-        :param numpy.1darray pulse_phs:
+        :param numpy.ndarray pulse_phs:
             Phase code sequence for pulse's phase modulation (deg).
             The array length should be the same as `pulses`. ``default 0``
+        :param numpy.ndarray out:
+            Complex array with the same shape as `pulse_phs` to write the
+            result into. A new array is allocated when not provided.
+            ``default None``
 
         :raises ValueError: Lengths of `pulse_amp` and `pulses` should be the same
         :raises ValueError: Length of `pulse_phs` and `pulses` should be the same
 
         :return:
             Pulse modulation array
-        :rtype: numpy.1darray
+        :rtype: numpy.ndarray
         """
-        if len(pulse_amp) != self.waveform_prop["pulses"]:
+        if np.shape(pulse_amp)[-1] != self.waveform_prop["pulses"]:
             raise ValueError("Lengths of `pulse_amp` and `pulses` should be the same")
-        if len(pulse_phs) != self.waveform_prop["pulses"]:
+        if np.shape(pulse_phs)[-1] != self.waveform_prop["pulses"]:
             raise ValueError("Length of `pulse_phs` and `pulses` should be the same")
 
-        return np.array(pulse_amp) * np.exp(
-            1j * (np.array(pulse_phs) * DEGREES_TO_RADIANS)
-        )
+        return self._polar_to_complex(pulse_amp, pulse_phs, out)
 
     def process_txchannel_prop(self, channels: List[Dict]) -> Dict:
         """
@@ -450,19 +565,43 @@ class Transmitter:
 
         txch_prop["size"] = len(channels)
 
+        # per-channel scalars in one record array, with
+        # `delay`, `grid` and `antenna_gains` as views of its fields
+        txch_prop["channel_params"] = np.empty(txch_prop["size"], dtype=_CHANNEL_DTYPE)
+
         # firing delay for each channel
-        txch_prop["delay"] = np.zeros(txch_prop["size"])
-        txch_prop["grid"] = np.zeros(txch_prop["size"])
-        txch_prop["locations"] = np.zeros((txch_prop["size"], 3))
-        txch_prop["polarization"] = np.zeros((txch_prop["size"], 3))
+        txch_prop["channel_params"]["delay"] = [
+            tx_element.get("delay", 0) for tx_element in channels
+        ]
+        txch_prop["channel_params"]["grid"] = [
+            tx_element.get("grid", DEFAULT_GRID_SIZE) for tx_element in channels
+        ]
+        txch_prop["delay"] = txch_prop["channel_params"]["delay"]
+        txch_prop["grid"] = txch_prop["channel_params"]["grid"]
+
+        # fixed-size channel vectors, gathered into one array per field
+        txch_prop["locations"] = np.asarray(
+            [tx_element["location"] for tx_element in channels], dtype=np.float64
+        )
+        txch_prop["polarization"] = np.asarray(
+            [
+                tx_element.get("polarization", DEFAULT_POLARIZATION)
+                for tx_element in channels
+            ],
+            dtype=np.complex128,
+        )
+        if txch_prop["locations"].shape != (txch_prop["size"], 3):
+            raise ValueError("`location` of each channel should be a 3D vector")
+        if txch_prop["polarization"].shape != (txch_prop["size"], 3):
+            raise ValueError("`polarization` of each channel should be a 3D vector")
 
         # waveform modulation parameters
         txch_prop["waveform_mod"] = []
 
         # pulse modulation parameters
-        txch_prop["pulse_mod"] = np.ones(
-            (txch_prop["size"], self.waveform_prop["pulses"]), dtype=complex
-        )
+        # collected for all the channels and converted in a single pass
+        pulse_amp = np.ones((txch_prop["size"], self.waveform_prop["pulses"]))
+        pulse_phs = np.zeros((txch_prop["size"], self.waveform_prop["pulses"]))
 
         # azimuth patterns
         txch_prop["az_patterns"] = []
@@ -472,19 +611,7 @@ class Transmitter:
         txch_prop["el_patterns"] = []
         txch_prop["el_angles"] = []
 
-        # antenna peak gain
-        # antenna gain is calculated based on azimuth pattern
-        txch_prop["antenna_gains"] = np.zeros((txch_prop["size"]))
-
         for tx_idx, tx_element in enumerate(channels):
-            txch_prop["delay"][tx_idx] = tx_element.get("delay", 0)
-            txch_prop["grid"][tx_idx] = tx_element.get("grid", DEFAULT_GRID_SIZE)
-
-            txch_prop["locations"][tx_idx, :] = np.array(tx_element.get("location"))
-            txch_prop["polarization"][tx_idx, :] = np.array(
-                tx_element.get("polarization", DEFAULT_POLARIZATION)
-            )
-
             txch_prop["waveform_mod"].append(
                 self.process_waveform_modulation(
                     tx_element.get("mod_t", None),
@@ -493,43 +620,81 @@ class Transmitter:
                 )
             )
 
-            txch_prop["pulse_mod"][tx_idx, :] = self.process_pulse_modulation(
-                tx_element.get("pulse_amp", np.ones((self.waveform_prop["pulses"]))),
-                tx_element.get("pulse_phs", np.zeros((self.waveform_prop["pulses"]))),
-            )
+            # rows default to unit amplitude and zero phase, so only the
+            # channels that provide a sequence need to be written
+            for key, pulse_var in (("pulse_amp", pulse_amp), ("pulse_phs", pulse_phs)):
+                if key not in tx_element:
+                    continue
+                if len(tx_element[key]) != self.waveform_prop["pulses"]:
+                    raise ValueError(
+                        f"Length mismatch for channel {tx_idx}: {key} "
+                        f"({len(tx_element[key])}) must match pulses "
+                        f"({self.waveform_prop['pulses']})"
+                    )
+                pulse_var[tx_idx, :] = tx_element[key]
 
             # azimuth pattern
-            az_angle = np.array(tx_element.get("azimuth_angle", DEFAULT_AZIMUTH_RANGE))
-            az_pattern = np.array(tx_element.get("azimuth_pattern", DEFAULT_PATTERN_DB))
+            az_angle = np.asarray(
+                tx_element.get("azimuth_angle", DEFAULT_AZIMUTH_RANGE),
+                dtype=np.float64,
+            )
+            az_pattern = np.asarray(
+                tx_element.get("azimuth_pattern", DEFAULT_PATTERN_DB),
+                dtype=np.float64,
+            )
             if len(az_angle) != len(az_pattern):
                 raise ValueError(
                     f"Length mismatch for channel {tx_idx}: azimuth_angle ({len(az_angle)}) "
                     f"and azimuth_pattern ({len(az_pattern)}) must have same length"
                 )
 
-            txch_prop["antenna_gains"][tx_idx] = np.max(az_pattern)
-            az_pattern = az_pattern - txch_prop["antenna_gains"][tx_idx]
-
             txch_prop["az_angles"].append(az_angle)
             txch_prop["az_patterns"].append(az_pattern)
 
             # elevation pattern
-            el_angle = np.array(
-                tx_element.get("elevation_angle", DEFAULT_ELEVATION_RANGE)
+            el_angle = np.asarray(
+                tx_element.get("elevation_angle", DEFAULT_ELEVATION_RANGE),
+                dtype=np.float64,
             )
-            el_pattern = np.array(
-                tx_element.get("elevation_pattern", DEFAULT_PATTERN_DB)
+            el_pattern = np.asarray(
+                tx_element.get("elevation_pattern", DEFAULT_PATTERN_DB),
+                dtype=np.float64,
             )
             if len(el_angle) != len(el_pattern):
                 raise ValueError(
                     f"Length mismatch for channel {tx_idx}: elevation_angle ({len(el_angle)}) "
                     f"and elevation_pattern ({len(el_pattern)}) must have same length"
                 )
-            el_pattern = el_pattern - np.max(el_pattern)
 
             txch_prop["el_angles"].append(el_angle)
             txch_prop["el_patterns"].append(el_pattern)
 
+        # [channels, points] arrays of the angles and patterns,
+        # None when the lengths differ between channels
+        for key in ("az_angles", "az_patterns", "el_angles", "el_patterns"):
+            txch_prop[key + "_mat"] = self._stack_uniform(txch_prop[key])
+            if txch_prop[key + "_mat"] is not None:
+                # keep the per-channel lists as row views of the stacked array
+                txch_prop[key] = list(txch_prop[key + "_mat"])
+
+        # antenna peak gain
+        # antenna gain is calculated based on azimuth pattern
+        txch_prop["az_patterns"], txch_prop["channel_params"]["gain"] = (
+            self._normalize_patterns(
+                txch_prop["az_patterns"], txch_prop["az_patterns_mat"]
+            )
+        )
+        txch_prop["antenna_gains"] = txch_prop["channel_params"]["gain"]
+        txch_prop["el_patterns"], _ = self._normalize_patterns(
+            txch_prop["el_patterns"], txch_prop["el_patterns_mat"]
+        )
+
+        # without phase codes the modulation is the real amplitude sequence
+        if any("pulse_phs" in tx_element for tx_element in channels):
+            txch_prop["pulse_mod"] = self.process_pulse_modulation(pulse_amp, pulse_phs)
+        else:
+            txch_prop["pulse_mod"] = pulse_amp
+
         return txch_prop
 
     @property
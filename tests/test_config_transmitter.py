@@ -54,6 +54,13 @@ class TestTransmitter:
         assert tx.waveform_prop["pulse_start_time"][0] == 0
         assert tx.waveform_prop["pulse_start_time"][9] == 1.8e-5
 
+        # Test non-uniform prp
+        prp = np.array([2e-6, 3e-6, 4e-6])
+        tx = Transmitter(f=self.f_single, t=self.t_single, pulses=3, prp=prp)
+        np.testing.assert_allclose(
+            tx.waveform_prop["pulse_start_time"], np.cumsum(prp) - prp[0]
+        )
+
     def test_property_methods(self):
         """Test all property getter methods."""
         tx = Transmitter(
@@ -171,6 +178,24 @@ class TestTransmitter:
         assert tx.frequency[1] == 11e9
         assert tx.bandwidth == 2e9  # Using property
 
+    def test_linear_fm(self):
+        """Test the linear frequency modulation constructor."""
+        tx = Transmitter.linear_fm(
+            9e9, 11e9, 1e-6, tx_power=self.tx_power, pulses=self.pulses, prp=self.prp
+        )
+        ref = Transmitter(
+            f=[9e9, 11e9],
+            t=1e-6,
+            tx_power=self.tx_power,
+            pulses=self.pulses,
+            prp=self.prp,
+        )
+        np.testing.assert_array_equal(tx.frequency, ref.frequency)
+        np.testing.assert_array_equal(tx.waveform_prop["t"], ref.waveform_prop["t"])
+        assert tx.bandwidth == ref.bandwidth
+        assert tx.pulse_length == ref.pulse_length
+        assert tx.num_pulses == self.pulses
+
     def test_init_arbitrary_waveform(self):
         """Test initialization with an arbitrary waveform."""
         f = np.linspace(9e9, 11e9, 100)
@@ -182,6 +207,11 @@ class TestTransmitter:
         np.testing.assert_allclose(tx.waveform_prop["t"], t)
         assert tx.pulse_length == pytest.approx(1e-6)  # Using property
 
+        # Time stamps not starting at zero are shifted
+        tx = Transmitter(f=f, t=t + 1e-6, pulses=self.pulses, prp=self.prp)
+        np.testing.assert_allclose(tx.waveform_prop["t"], t, atol=1e-18)
+        assert tx.pulse_length == pytest.approx(1e-6)
+
     def test_init_frequency_offset(self):
         """Test initialization with frequency offset."""
         f_offset = np.linspace(0, 1e6, 10)
@@ -265,6 +295,15 @@ class TestTransmitter:
             tx.rf_prop["pn_power"] = np.array([-100])
             tx.validate_rf_prop(tx.rf_prop)
 
+    def test_skip_validation(self):
+        """Test that trusted construction skips property validation."""
+        # prp shorter than the pulse length is normally rejected
+        with pytest.raises(ValueError):
+            Transmitter(f=self.f_single, t=self.t_single, prp=1e-7)
+
+        tx = Transmitter(f=self.f_single, t=self.t_single, prp=1e-7, _validated=True)
+        assert tx.waveform_prop["prp"][0] == 1e-7
+
     def test_validate_waveform_prop(self):
         """Test validation of waveform properties."""
         tx = Transmitter(
@@ -376,6 +415,12 @@ class TestTransmitter:
             np.unwrap(np.angle(pulse_mod)) / np.pi * 180, pulse_phs
         )
 
+        # Test writing into a preallocated output array
+        out = np.zeros(10, dtype=complex)
+        result = tx.process_pulse_modulation(pulse_amp, pulse_phs, out=out)
+        assert result is out
+        np.testing.assert_allclose(out, pulse_mod)
+
         with pytest.raises(ValueError):
             tx.process_pulse_modulation(pulse_amp[:-1], pulse_phs)
         with pytest.raises(ValueError):
@@ -417,6 +462,10 @@ class TestTransmitter:
         np.testing.assert_allclose(txch_prop["locations"], [[0, 0, 0], [10, 0, 0]])
         np.testing.assert_allclose(txch_prop["polarization"], [[1, 0, 0], [0, 1, 0]])
         np.testing.assert_allclose(txch_prop["antenna_gains"], [0, -10])
+        np.testing.assert_allclose(txch_prop["channel_params"]["delay"], [1e-6, 2e-6])
+        np.testing.assert_allclose(txch_prop["channel_params"]["grid"], [1, 1])
+        np.testing.assert_allclose(txch_prop["channel_params"]["gain"], [0, -10])
+        assert np.shares_memory(txch_prop["delay"], txch_prop["channel_params"])
         np.testing.assert_allclose(
             np.abs(txch_prop["pulse_mod"][0, :]), np.linspace(0, 1, 10)
         )
@@ -435,6 +484,12 @@ class TestTransmitter:
         assert txch_prop["waveform_mod"][0]["enabled"]
         assert txch_prop["waveform_mod"][1]["enabled"] is False
 
+        with pytest.raises(
+            ValueError,
+            match="Length mismatch for channel 1: pulse_phs \\(9\\) must match pulses \\(10\\)",
+        ):
+            channels[1]["pulse_phs"] = np.zeros(9)
+            tx.process_txchannel_prop(channels)
         with pytest.raises(ValueError):
             channels[0]["azimuth_angle"] = [-90, 90, 0]
             tx.process_txchannel_prop(channels)
@@ -442,6 +497,59 @@ class TestTransmitter:
             channels[0]["elevation_angle"] = [-90, 90, 0]
             tx.process_txchannel_prop(channels)
 
+    def test_process_txchannel_prop_vectors(self):
+        """Test channel location and polarization vectors."""
+        tx = Transmitter(f=10e9, t=1e-6)
+        channels = [
+            {"location": (0, 0, 0), "polarization": [0, 1, 1j]},
+            {"location": (1, 0, 0), "polarization": [0, 1, -1j]},
+        ]
+        txch_prop = tx.process_txchannel_prop(channels)
+        assert txch_prop["locations"].dtype == np.float64
+        assert txch_prop["az_angles"][0].dtype == np.float64
+        assert txch_prop["el_angles"][0].dtype == np.float64
+        np.testing.assert_array_equal(
+            txch_prop["polarization"], [[0, 1, 1j], [0, 1, -1j]]
+        )
+
+        with pytest.raises(ValueError, match="should be a 3D vector"):
+            tx.process_txchannel_prop([{"location": (0, 0)}])
+
+    def test_antenna_pattern_normalization(self):
+        """Test antenna pattern normalization for equal and ragged lengths."""
+        tx = Transmitter(f=10e9, t=1e-6)
+        channels = [
+            {
+                "location": (0, 0, 0),
+                "azimuth_angle": [-90, 0, 90],
+                "azimuth_pattern": [-20, 5, -20],
+            },
+            {
+                "location": (1, 0, 0),
+                "azimuth_angle": [-90, 0, 90],
+                "azimuth_pattern": [-10, 3, -10],
+            },
+        ]
+        txch_prop = tx.process_txchannel_prop(channels)
+        np.testing.assert_allclose(txch_prop["antenna_gains"], [5, 3])
+        np.testing.assert_allclose(txch_prop["az_patterns"][0], [-25, 0, -25])
+        np.testing.assert_allclose(txch_prop["az_patterns"][1], [-13, 0, -13])
+        np.testing.assert_allclose(
+            txch_prop["az_patterns_mat"], [[-25, 0, -25], [-13, 0, -13]]
+        )
+        np.testing.assert_allclose(txch_prop["az_angles_mat"], [[-90, 0, 90]] * 2)
+        np.testing.assert_allclose(txch_prop["el_patterns_mat"], np.zeros((2, 2)))
+
+        # Ragged patterns are normalized per channel
+        channels[1]["azimuth_angle"] = [-90, 90]
+        channels[1]["azimuth_pattern"] = [-10, 3]
+        txch_prop = tx.process_txchannel_prop(channels)
+        np.testing.assert_allclose(txch_prop["antenna_gains"], [5, 3])
+        np.testing.assert_allclose(txch_prop["az_patterns"][0], [-25, 0, -25])
+        np.testing.assert_allclose(txch_prop["az_patterns"][1], [-13, 0])
+        assert txch_prop["az_patterns_mat"] is None
+        assert txch_prop["az_angles_mat"] is None
+
     def test_init_channels(self):
         """Test initialization with multiple channels."""
         channels = [
@@ -461,6 +569,18 @@ class TestTransmitter:
             tx.channel_locations, [[0, 0, 0], [10, 0, 0]]  # Using property
         )
 
+        # Channels without waveform modulation share the disabled entry
+        assert not tx.txchannel_prop["waveform_mod"][0]["enabled"]
+        assert (
+            tx.txchannel_prop["waveform_mod"][0] is tx.txchannel_prop["waveform_mod"][1]
+        )
+
+        # Without phase codes the pulse modulation stays real-valued
+        assert tx.txchannel_prop["pulse_mod"].dtype == np.float64
+        np.testing.assert_array_equal(
+            tx.txchannel_prop["pulse_mod"], np.ones((2, self.pulses))
+        )
+
     def test_init_channels_with_modulation(self):
         """Test initialization with multiple channels and modulation."""
         channels = [